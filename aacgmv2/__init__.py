@@ -15,6 +15,8 @@ high_alt_coeff : (float)
     Upper altitude limit for using coefficients in km
 high_alt_trace : (float)
     Upper altitude limit for using field-line tracing in km
+min_pool_size : (int)
+    Minimum number of locations converted using multiple processes
 AACGM_V2_DAT_PREFIX : (str)
     Location of AACGM-V2 coefficient files with the file prefix
 IGRF_COEFFS : (str)
@@ -27,7 +29,8 @@ import os as _os
 from sys import stderr
 
 from aacgmv2.wrapper import (convert_latlon, convert_mlt, get_aacgm_coord)
-from aacgmv2.wrapper import (convert_latlon_arr, get_aacgm_coord_arr)
+from aacgmv2.wrapper import (convert_latlon_arr, convert_latlon_coords,
+                             get_aacgm_coord_arr)
 from aacgmv2.wrapper import (convert_bool_to_bit, convert_str_to_bit)
 from aacgmv2 import (utils)
 from aacgmv2 import (deprecated)
@@ -43,6 +46,9 @@ logger = logging.getLogger('aacgmv2_logger')
 high_alt_coeff = 2000.0  # Tested and published in Shepherd (2014)
 high_alt_trace = 6378.0  # 1 RE, these are ionospheric coordinates
 
+# Smaller arrays are converted faster than a process pool can be started
+min_pool_size = 10000
+
 # path and filename prefix for the IGRF coefficients
 AACGM_v2_DAT_PREFIX = _os.path.join(_os.path.realpath(
     _os.path.dirname(__file__)), 'aacgm_coeffs', 'aacgm_coeffs-13-')
@@ -19,6 +19,9 @@
  *****************************************************************************/
 
 #include <Python.h>
+#include <datetime.h>
+#include <math.h>
+#include <string.h>
 
 #include "aacgmlib_v2.h"
 #include "mlt_v2.h"
@@ -29,6 +32,76 @@ PyObject *module;
 #define PyInt_AsLong PyLong_AsLong
 #endif
 
+/* Get a one-dimensional buffer of doubles from a Python object */
+static int get_double_buffer(PyObject *obj, Py_buffer *view, int flags)
+{
+  if(PyObject_GetBuffer(obj, view, flags | PyBUF_FORMAT) < 0)
+    return(-1);
+
+  if(view->ndim > 1 || view->itemsize != sizeof(double)
+     || strcmp(view->format, "d") != 0)
+    {
+      PyBuffer_Release(view);
+      PyErr_SetString(PyExc_TypeError,
+		      "buffers must be one-dimensional and of type float64");
+      return(-1);
+    }
+
+  return(0);
+}
+
+/* Get the byte stride between values in a one-dimensional buffer */
+static Py_ssize_t buffer_stride(Py_buffer *view)
+{
+  if(view->ndim == 0)
+    return(0);
+
+  return((view->strides == NULL) ? view->itemsize : view->strides[0]);
+}
+
+/* Get a pointer to the value at the specified index of a strided buffer */
+#define BUFFER_DOUBLE(buf, stride, i) \
+  ((double *)((char *)(buf) + (i) * (stride)))
+
+/* Buffer flags for strided input and contiguous or strided, writable output */
+#define IN_BUFFER PyBUF_STRIDES
+#define OUT_BUFFER (PyBUF_C_CONTIGUOUS | PyBUF_WRITABLE)
+#define STRIDED_OUT_BUFFER (PyBUF_STRIDES | PyBUF_WRITABLE)
+
+/* Release the first nbuf buffers */
+static void release_double_buffers(int nbuf, Py_buffer *views)
+{
+  int i;
+
+  for(i=0; i<nbuf; i++)
+    PyBuffer_Release(&views[i]);
+}
+
+/* Get equal-length buffers of doubles, releasing them all on failure */
+static int get_double_buffers(int nbuf, PyObject **objs, const int *flags,
+			      Py_buffer *views)
+{
+  int i;
+
+  for(i=0; i<nbuf; i++)
+    {
+      if(get_double_buffer(objs[i], &views[i], flags[i]) < 0)
+	{
+	  release_double_buffers(i, views);
+	  return(-1);
+	}
+
+      if(views[i].len != views[0].len)
+	{
+	  release_double_buffers(i + 1, views);
+	  PyErr_SetString(PyExc_ValueError, "buffer lengths are mismatched");
+	  return(-1);
+	}
+    }
+
+  return(0);
+}
+
 static PyObject *aacgm_v2_setdatetime(PyObject *self, PyObject *args)
 {
   int year, month, day, hour, minute, second, err;
@@ -51,6 +124,34 @@ static PyObject *aacgm_v2_setdatetime(PyObject *self, PyObject *args)
   Py_RETURN_NONE;
 }
 
+static PyObject *aacgm_v2_setdatetime_obj(PyObject *self, PyObject *args)
+{
+  int err;
+
+  PyObject *dtime;
+
+  /* Parse the input as a tupple, which must hold a datetime object */
+  if(!PyArg_ParseTuple(args, "O!", PyDateTimeAPI->DateTimeType, &dtime))
+    return(NULL);
+
+  /* Call the AACGM routine, reading the time directly from the object */
+  err = AACGM_v2_SetDateTime(PyDateTime_GET_YEAR(dtime),
+			     PyDateTime_GET_MONTH(dtime),
+			     PyDateTime_GET_DAY(dtime),
+			     PyDateTime_DATE_GET_HOUR(dtime),
+			     PyDateTime_DATE_GET_MINUTE(dtime),
+			     PyDateTime_DATE_GET_SECOND(dtime));
+
+  if(err < 0)
+    {
+      PyErr_Format(PyExc_RuntimeError,
+		   "AACGM_v2_SetDateTime returned error code %d", err);
+      return(NULL);
+    }
+
+  Py_RETURN_NONE;
+}
+
 static PyObject *aacgm_v2_convert_arr(PyObject *self, PyObject *args)
 {
   int i, code, err;
@@ -110,6 +211,64 @@ static PyObject *aacgm_v2_convert_arr(PyObject *self, PyObject *args)
   return allOut;
 }
 
+static PyObject *aacgm_v2_convert_buf(PyObject *self, PyObject *args)
+{
+  int code, err;
+
+  const int flags[6] = {IN_BUFFER, IN_BUFFER, IN_BUFFER, STRIDED_OUT_BUFFER,
+			STRIDED_OUT_BUFFER, STRIDED_OUT_BUFFER};
+
+  Py_ssize_t i, j, in_num, strides[6];
+
+  double *out_lat, *out_lon, *out_r;
+
+  PyObject *bufObj[6];
+
+  Py_buffer views[6];
+
+  /* Parse the input as a tuple */
+  if(!PyArg_ParseTuple(args, "OOOiOOO", &bufObj[0], &bufObj[1], &bufObj[2],
+		       &code, &bufObj[3], &bufObj[4], &bufObj[5]))
+    return(NULL);
+
+  /* Get the input and output buffers, which must all be the same length */
+  if(get_double_buffers(6, bufObj, flags, views) < 0)
+    return(NULL);
+
+  /* Buffers may be strided, allowing broadcast arrays and the columns of a
+     two-dimensional array to be passed uncopied */
+  in_num = views[0].len / (Py_ssize_t)sizeof(double);
+  for(j=0; j<6; j++)
+    strides[j] = buffer_stride(&views[j]);
+
+  /* Cycle through all of the inputs, filling bad conversions with NaN.  The
+     loop is serial and keeps the GIL: AACGM_v2_Convert updates the global
+     coefficient, height, and IGRF state in the C library, so concurrent
+     calls (OpenMP threads, or other Python threads calling set_datetime)
+     would corrupt the results */
+  for(i=0; i<in_num; i++)
+    {
+      out_lat = BUFFER_DOUBLE(views[3].buf, strides[3], i);
+      out_lon = BUFFER_DOUBLE(views[4].buf, strides[4], i);
+      out_r   = BUFFER_DOUBLE(views[5].buf, strides[5], i);
+
+      err = AACGM_v2_Convert(*BUFFER_DOUBLE(views[0].buf, strides[0], i),
+			     *BUFFER_DOUBLE(views[1].buf, strides[1], i),
+			     *BUFFER_DOUBLE(views[2].buf, strides[2], i),
+			     out_lat, out_lon, out_r, code);
+      if(err < 0)
+	{
+	  *out_lat = NAN;
+	  *out_lon = NAN;
+	  *out_r = NAN;
+	}
+    }
+
+  release_double_buffers(6, views);
+
+  Py_RETURN_NONE;
+}
+
 static PyObject *aacgm_v2_convert(PyObject *self, PyObject *args)
 {
   int code, err;
@@ -134,6 +293,175 @@ static PyObject *aacgm_v2_convert(PyObject *self, PyObject *args)
   return Py_BuildValue("ddd", out_lat, out_lon, out_r);
 }
 
+/* Get the MLT at a magnetic longitude of zero, which also sets the AACGM date
+ * and time if needed.  The AACGM-v2 MLT routines offset the magnetic
+ * longitude by that of the subsolar point, so this reference may be computed
+ * once and applied to many values.  Errors are returned as values outside of
+ * the MLT range, raising a RuntimeError here */
+static int mlt_reference(int yr, int mo, int dy, int hr, int mt, int sc,
+			 double *ref_mlt)
+{
+  *ref_mlt = MLTConvertYMDHMS_v2(yr, mo, dy, hr, mt, sc, 0.0);
+
+  if(isnan(*ref_mlt))
+    {
+      PyErr_SetString(PyExc_RuntimeError,
+		      "unable to calculate MLT reference, result is NaN");
+      return(-1);
+    }
+
+  if(!isfinite(*ref_mlt) || *ref_mlt < 0.0 || *ref_mlt > 24.0)
+    {
+      /* PyErr_Format does not support floating point values, the library
+	 error codes are integers */
+      PyErr_Format(PyExc_RuntimeError,
+		   "unable to calculate MLT reference, error code %d",
+		   (int)*ref_mlt);
+      return(-1);
+    }
+
+  return(0);
+}
+
+/* MLT from 0 to 24 hours for a magnetic longitude, given the MLT reference */
+static double mlon_to_mlt(double ref_mlt, double mlon)
+{
+  double mlt;
+
+  mlt = fmod(ref_mlt + mlon / 15.0, 24.0);
+
+  return((mlt < 0.0) ? mlt + 24.0 : mlt);
+}
+
+/* Magnetic longitude from -180 to 180 degrees for an MLT, given the MLT
+ * reference */
+static double mlt_to_mlon(double ref_mlt, double mlt)
+{
+  double mlon;
+
+  mlon = fmod((mlt - ref_mlt) * 15.0 + 180.0, 360.0);
+
+  return(((mlon < 0.0) ? mlon + 360.0 : mlon) - 180.0);
+}
+
+/* Apply an MLT conversion at a single time to all values in a buffer, using
+ * a single MLT reference */
+static PyObject *mltconvert_v2_buf_loop(PyObject *args, int inverse)
+{
+  int yr, mo, dy, hr, mt, sc;
+
+  const int flags[2] = {IN_BUFFER, OUT_BUFFER};
+
+  Py_ssize_t i, in_num, in_stride;
+
+  double ref_mlt, in_val, *out_val;
+
+  PyObject *bufObj[2];
+
+  Py_buffer views[2];
+
+  /* Parse the input as a tupple */
+  if(!PyArg_ParseTuple(args, "iiiiiiOO", &yr, &mo, &dy, &hr, &mt, &sc,
+		       &bufObj[0], &bufObj[1]))
+    return(NULL);
+
+  /* Get the MLT reference for this time */
+  if(mlt_reference(yr, mo, dy, hr, mt, sc, &ref_mlt) < 0)
+    return(NULL);
+
+  /* Get the input and output buffers, which must be the same length */
+  if(get_double_buffers(2, bufObj, flags, views) < 0)
+    return(NULL);
+
+  in_num    = views[0].len / (Py_ssize_t)sizeof(double);
+  in_stride = buffer_stride(&views[0]);
+  out_val   = (double *)views[1].buf;
+
+  /* Cycle through all of the inputs, non-finite values result in NaN */
+  for(i=0; i<in_num; i++)
+    {
+      in_val = *BUFFER_DOUBLE(views[0].buf, in_stride, i);
+      out_val[i] = (inverse) ? mlt_to_mlon(ref_mlt, in_val)
+	: mlon_to_mlt(ref_mlt, in_val);
+    }
+
+  release_double_buffers(2, views);
+
+  Py_RETURN_NONE;
+}
+
+static PyObject *mltconvert_v2_buf(PyObject *self, PyObject *args)
+{
+  return mltconvert_v2_buf_loop(args, 0);
+}
+
+static PyObject *inv_mltconvert_v2_buf(PyObject *self, PyObject *args)
+{
+  return mltconvert_v2_buf_loop(args, 1);
+}
+
+static PyObject *aacgm_v2_convert_mlt_buf(PyObject *self, PyObject *args)
+{
+  int code, err, yr, mo, dy, hr, mt, sc;
+
+  const int flags[7] = {IN_BUFFER, IN_BUFFER, IN_BUFFER, OUT_BUFFER,
+			OUT_BUFFER, OUT_BUFFER, OUT_BUFFER};
+
+  Py_ssize_t i, in_num, lat_stride, lon_stride, h_stride;
+
+  double ref_mlt, *out_lat, *out_lon, *out_r, *out_mlt;
+
+  PyObject *bufObj[7];
+
+  Py_buffer views[7];
+
+  /* Parse the input as a tuple */
+  if(!PyArg_ParseTuple(args, "OOOiiiiiiiOOOO", &bufObj[0], &bufObj[1],
+		       &bufObj[2], &code, &yr, &mo, &dy, &hr, &mt, &sc,
+		       &bufObj[3], &bufObj[4], &bufObj[5], &bufObj[6]))
+    return(NULL);
+
+  /* Get the MLT reference for this time before converting any locations */
+  if(mlt_reference(yr, mo, dy, hr, mt, sc, &ref_mlt) < 0)
+    return(NULL);
+
+  /* Get the input and output buffers, which must all be the same length */
+  if(get_double_buffers(7, bufObj, flags, views) < 0)
+    return(NULL);
+
+  in_num     = views[0].len / (Py_ssize_t)sizeof(double);
+  lat_stride = buffer_stride(&views[0]);
+  lon_stride = buffer_stride(&views[1]);
+  h_stride   = buffer_stride(&views[2]);
+  out_lat = (double *)views[3].buf;
+  out_lon = (double *)views[4].buf;
+  out_r   = (double *)views[5].buf;
+  out_mlt = (double *)views[6].buf;
+
+  /* Convert each location and find the MLT of the magnetic longitude in the
+     same pass, filling bad conversions with NaN */
+  for(i=0; i<in_num; i++)
+    {
+      err = AACGM_v2_Convert(*BUFFER_DOUBLE(views[0].buf, lat_stride, i),
+			     *BUFFER_DOUBLE(views[1].buf, lon_stride, i),
+			     *BUFFER_DOUBLE(views[2].buf, h_stride, i),
+			     &out_lat[i], &out_lon[i], &out_r[i], code);
+      if(err < 0)
+	{
+	  out_lat[i] = NAN;
+	  out_lon[i] = NAN;
+	  out_r[i] = NAN;
+	  out_mlt[i] = NAN;
+	}
+      else
+	out_mlt[i] = mlon_to_mlt(ref_mlt, out_lon[i]);
+    }
+
+  release_double_buffers(7, views);
+
+  Py_RETURN_NONE;
+}
+
 static PyObject *mltconvert_v2_arr(PyObject *self, PyObject *args)
 {
   int i, in_yr, in_mo, in_dy, in_hr, in_mt, in_sc;
@@ -308,6 +636,24 @@ second : (int)\n\
 Returns\n\
 -------------\n\
 Void\n" },
+  { "set_datetime_obj", aacgm_v2_setdatetime_obj, METH_VARARGS,
+    "set_datetime_obj(dtime)\n\
+\n\
+Sets the date and time for the IGRF magnetic field from a datetime object.\n\
+\n\
+Parameters \n\
+-------------\n\
+dtime : (datetime.datetime)\n\
+    Date and time, with a four digit year starting from 1900, ending 2020\n\
+\n\
+Returns\n\
+-------------\n\
+Void\n\
+\n\
+Notes \n\
+-----\n\
+Equivalent to set_datetime, but reads the date and time directly from the\n\
+datetime object instead of from six Python integers.\n" },
   { "convert", aacgm_v2_convert, METH_VARARGS,
     "convert(in_lat, in_lon, height, code)\n\
 \n\
@@ -375,6 +721,94 @@ Notes \n\
 -----\n\
 Return values of -666 are used as filler values for lat/lon/r, while filler\n\
 values of -1 are used in out_bad if the output in out_lat/lon/r is good\n", },
+  { "convert_buf", aacgm_v2_convert_buf, METH_VARARGS,
+    "convert_buf(in_lat, in_lon, height, code, out_lat, out_lon, out_r)\n\
+\n\
+Converts between geographic/dedic and magnetic coordinates, reading from\n\
+and writing to float64 buffers (e.g., numpy arrays), which may be strided.\n\
+\n\
+Parameters\n\
+-------------\n\
+in_lat : (buffer)\n\
+    Input latitudes in degrees N (code specifies type of latitude)\n\
+in_lon : (buffer)\n\
+    Input longitudes in degrees E (code specifies type of longitude)\n\
+height : (buffer)\n\
+    Altitudes above the surface of the earth in km\n\
+code : (int)	\n\
+    Bitwise code for passing options into converter (default=0)\n\
+    0  - G2A        - geographic (geodetic) to AACGM-v2	\n\
+    1  - A2G        - AACGM-v2 to geographic (geodetic)	\n\
+    2  - TRACE      - use field-line tracing, not coefficients\n\
+    4  - ALLOWTRACE - use trace only above 2000 km\n\
+    8  - BADIDEA    - use coefficients above 2000 km\n\
+    16 - GEOCENTRIC - assume inputs are geocentric w/ RE=6371.2\n\
+out_lat : (buffer)\n\
+    Writable buffer for the output latitudes in degrees\n\
+out_lon : (buffer)\n\
+    Writable buffer for the output longitudes in degrees\n\
+out_r : (buffer)\n\
+    Writable buffer for the output geocentric radial distances in Re\n\
+\n\
+Returns	\n\
+-------\n\
+Void\n\
+\n\
+Notes \n\
+-----\n\
+All buffers must have the same length and may be strided (e.g., broadcast\n\
+numpy arrays or the columns of a two-dimensional array).\n\
+Locations that cannot be converted are set to NaN in the output buffers.\n\
+The C library is not thread-safe, so the GIL is held during the conversion.\n", },
+  { "convert_mlt_buf", aacgm_v2_convert_mlt_buf, METH_VARARGS,
+    "convert_mlt_buf(in_lat, in_lon, height, code, yr, mo, dy, hr, mt, sc, \
+out_lat, out_lon, out_r, out_mlt)\n\
+\n\
+Converts geographic/dedic to magnetic coordinates and magnetic local time.\n\
+\n\
+Parameters\n\
+-------------\n\
+in_lat : (buffer)\n\
+    One-dimensional float64 buffer of input latitudes in degrees N\n\
+in_lon : (buffer)\n\
+    One-dimensional float64 buffer of input longitudes in degrees E\n\
+height : (buffer)\n\
+    One-dimensional float64 buffer of altitudes above the surface of the\n\
+    earth in km\n\
+code : (int)	\n\
+    Bitwise code for passing options into converter, must include G2A\n\
+yr : (int)\n\
+    4 digit integer year (1900-2020)\n\
+mo : (int)\n\
+    Month of year (1-12)\n\
+dy : (int)\n\
+    Day of month (1-31)\n\
+hr : (int)\n\
+    hours of day (0-23)\n\
+mt : (int)\n\
+    Minutes of hour (0-59)\n\
+sc : (int)\n\
+    Seconds of minute (0-59)\n\
+out_lat : (buffer)\n\
+    Writable buffer for the output magnetic latitudes in degrees\n\
+out_lon : (buffer)\n\
+    Writable buffer for the output magnetic longitudes in degrees\n\
+out_r : (buffer)\n\
+    Writable buffer for the output geocentric radial distances in Re\n\
+out_mlt : (buffer)\n\
+    Writable buffer for the output magnetic local times in hours\n\
+\n\
+Returns	\n\
+-------\n\
+Void\n\
+\n\
+Notes \n\
+-----\n\
+Combines convert_buf and mlt_convert_buf in a single pass over the\n\
+locations.  The AACGM-v2 date and time must already be set to the same\n\
+time as the MLT.  All buffers must have the same length.  Input buffers\n\
+may be strided, while output buffers must be C-contiguous.  Locations\n\
+that cannot be converted are set to NaN in all output buffers.\n", },
   {"mlt_convert_arr", mltconvert_v2_arr, METH_VARARGS,
     "mlt_convert_arr(yr, mo, dy, hr, mt, sc, mlon)\n\
 \n\
@@ -401,6 +835,40 @@ Returns	\n\
 -------\n\
 mlt : (list)\n\
     Magnetic local time (hours)\n" },
+  {"mlt_convert_buf", mltconvert_v2_buf, METH_VARARGS,
+    "mlt_convert_buf(yr, mo, dy, hr, mt, sc, mlon, mlt)\n\
+\n\
+Converts from universal time to magnetic local time for a float64 buffer\n\
+(e.g., numpy array) of magnetic longitudes at a single time.\n\
+\n\
+Parameters\n\
+-------------\n\
+yr : (int)\n\
+    4 digit integer year (1900-2020)\n\
+mo : (int)\n\
+    Month of year (1-12)\n\
+dy : (int)\n\
+    Day of month (1-31)\n\
+hr : (int)\n\
+    hours of day (0-23)\n\
+mt : (int)\n\
+    Minutes of hour (0-59)\n\
+sc : (int)\n\
+    Seconds of minute (0-59)\n\
+mlon : (buffer)\n\
+    Magnetic longitudes, may be strided\n\
+mlt : (buffer)\n\
+    Writable, C-contiguous buffer for the magnetic local times (hours)\n\
+\n\
+Returns	\n\
+-------\n\
+Void\n\
+\n\
+Notes \n\
+-----\n\
+The subsolar reference longitude is only calculated once, making this much\n\
+faster than calling mlt_convert for each value.  Non-finite magnetic\n\
+longitudes are converted to NaN.\n" },
   {"mlt_convert", mltconvert_v2, METH_VARARGS,
     "mlt_convert(yr, mo, dy, hr, mt, sc, mlon)\n\
 \n\
@@ -473,6 +941,42 @@ Returns	\n\
 mlon : (list)\n\
     Magnetic longitude (degrees)\n" },
 
+  {"inv_mlt_convert_buf", inv_mltconvert_v2_buf, METH_VARARGS,
+    "inv_mlt_convert_buf(yr, mo, dy, hr, mt, sc, mlt, mlon)\n\
+\n\
+Converts from universal time and magnetic local time to magnetic longitude\n\
+for a float64 buffer (e.g., numpy array) of magnetic local times at a single\n\
+time.\n\
+\n\
+Parameters\n\
+-------------\n\
+yr : (int)\n\
+    4 digit integer year (1900-2020)\n\
+mo : (int)\n\
+    Month of year (1-12)\n\
+dy : (int)\n\
+    Day of month (1-31)\n\
+hr : (int)\n\
+    hours of day (0-23)\n\
+mt : (int)\n\
+    Minutes of hour (0-59)\n\
+sc : (int)\n\
+    Seconds of minute (0-59)\n\
+mlt : (buffer)\n\
+    Magnetic local times, may be strided\n\
+mlon : (buffer)\n\
+    Writable, C-contiguous buffer for the magnetic longitudes (degrees)\n\
+\n\
+Returns	\n\
+-------\n\
+Void\n\
+\n\
+Notes \n\
+-----\n\
+The subsolar reference longitude is only calculated once, making this much\n\
+faster than calling inv_mlt_convert for each value.  Non-finite magnetic\n\
+local times are converted to NaN.\n" },
+
   {"inv_mlt_convert", inv_mltconvert_v2, METH_VARARGS,
     "inv_mlt_convert(yr, mo, dy, hr, mt, sc, mlt)\n\
 \n\
@@ -535,6 +1039,12 @@ static struct PyModuleDef aacgmv2module = {
 PyMODINIT_FUNC PyInit__aacgmv2(void)
 {
   module = PyModule_Create(&aacgmv2module);
+
+  /* Import the datetime C API, used by set_datetime_obj */
+  PyDateTime_IMPORT;
+  if(PyDateTimeAPI == NULL)
+    return(NULL);
+
   PyModule_AddIntConstant(module, "G2A", G2A);
   PyModule_AddIntConstant(module, "A2G", A2G);
   PyModule_AddIntConstant(module, "TRACE", TRACE);
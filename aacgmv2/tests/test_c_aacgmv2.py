@@ -56,6 +56,27 @@ class TestCAACGMV2:
         with pytest.raises(RuntimeError):
             aacgmv2._aacgmv2.set_datetime(*self.long_date)
 
+    @pytest.mark.parametrize('idate', [0, 1])
+    def test_set_datetime_obj(self, idate):
+        """Test set_datetime_obj sets the same time as set_datetime"""
+        aacgmv2._aacgmv2.set_datetime(*self.date_args[1 - idate])
+        aacgmv2._aacgmv2.set_datetime_obj(dt.datetime(*self.date_args[idate]))
+        out_obj = aacgmv2._aacgmv2.convert(self.lat_in[0], self.lon_in[0],
+                                           self.alt_in[0], self.code['G2A'])
+        aacgmv2._aacgmv2.set_datetime(*self.date_args[idate])
+        out_ints = aacgmv2._aacgmv2.convert(self.lat_in[0], self.lon_in[0],
+                                            self.alt_in[0], self.code['G2A'])
+        np.testing.assert_equal(out_obj, out_ints)
+
+    @pytest.mark.parametrize('dtime,err',
+                             [(dt.datetime(1013, 1, 1), RuntimeError),
+                              (dt.date(2015, 1, 1), TypeError),
+                              ((2015, 1, 1, 0, 0, 0), TypeError)])
+    def test_fail_set_datetime_obj(self, dtime, err):
+        """Test unsuccessful set_datetime_obj"""
+        with pytest.raises(err):
+            aacgmv2._aacgmv2.set_datetime_obj(dtime)
+
     @pytest.mark.parametrize('idate,ckey', [(0, 'G2A'), (1, 'G2A'),
                                             (0, 'A2G'), (1, 'A2G'),
                                             (0, 'TG2A'), (1, 'TG2A'),
@@ -93,6 +114,141 @@ class TestCAACGMV2:
                                        decimal=4)
         np.testing.assert_equal(bad_ind[0], -1)
 
+    @pytest.mark.parametrize('ckey', ['G2A', 'A2G', 'TG2A', 'TA2G'])
+    def test_convert_buf(self, ckey):
+        """Test convert_buf using numpy arrays as input and output buffers"""
+        aacgmv2._aacgmv2.set_datetime(*self.date_args[0])
+        self.mlat = np.empty(shape=(len(self.lat_in),), dtype=np.float64)
+        self.mlon = np.empty(shape=self.mlat.shape, dtype=np.float64)
+        self.rshell = np.empty(shape=self.mlat.shape, dtype=np.float64)
+        aacgmv2._aacgmv2.convert_buf(np.array(self.lat_in, dtype=np.float64),
+                                     np.array(self.lon_in, dtype=np.float64),
+                                     np.array(self.alt_in, dtype=np.float64),
+                                     self.code[ckey], self.mlat, self.mlon,
+                                     self.rshell)
+
+        np.testing.assert_almost_equal(self.mlat[0], self.lat_comp[ckey][0],
+                                       decimal=4)
+        np.testing.assert_almost_equal(self.mlon[0], self.lon_comp[ckey][0],
+                                       decimal=4)
+        np.testing.assert_almost_equal(self.rshell[0], self.r_comp[ckey][0],
+                                       decimal=4)
+
+    def test_convert_buf_strided(self):
+        """Test convert_buf with broadcast and strided input buffers"""
+        aacgmv2._aacgmv2.set_datetime(*self.date_args[1])
+        self.mlat = np.empty(shape=(2,), dtype=np.float64)
+        self.mlon = np.empty(shape=(2,), dtype=np.float64)
+        self.rshell = np.empty(shape=(2,), dtype=np.float64)
+        aacgmv2._aacgmv2.convert_buf(np.broadcast_to(float(self.lat_in[1]),
+                                                     (2,)),
+                                     np.array([self.lon_in[1], 1.0,
+                                               self.lon_in[1], 1.0])[::2],
+                                     np.broadcast_to(float(self.alt_in[1]),
+                                                     (2,)),
+                                     self.code['G2A'], self.mlat, self.mlon,
+                                     self.rshell)
+
+        np.testing.assert_almost_equal(self.mlat, self.lat_comp['G2A'][1],
+                                       decimal=4)
+        np.testing.assert_almost_equal(self.mlon, self.lon_comp['G2A'][1],
+                                       decimal=4)
+        np.testing.assert_almost_equal(self.rshell, self.r_comp['G2A'][1],
+                                       decimal=4)
+
+    def test_convert_buf_strided_output(self):
+        """Test convert_buf with the columns of arrays as strided buffers"""
+        aacgmv2._aacgmv2.set_datetime(*self.date_args[0])
+        self.lat_in = np.array([self.lat_in, self.lon_in, self.alt_in],
+                               dtype=np.float64).transpose()
+        self.mlat = np.empty(shape=(2, 3), dtype=np.float64)
+        aacgmv2._aacgmv2.convert_buf(self.lat_in[:, 0], self.lat_in[:, 1],
+                                     self.lat_in[:, 2], self.code['G2A'],
+                                     self.mlat[:, 0], self.mlat[:, 1],
+                                     self.mlat[:, 2])
+
+        np.testing.assert_almost_equal(self.mlat[0], [self.lat_comp['G2A'][0],
+                                                      self.lon_comp['G2A'][0],
+                                                      self.r_comp['G2A'][0]],
+                                       decimal=4)
+
+    def test_convert_buf_forbidden(self):
+        """Test convert_buf fills forbidden locations with NaN"""
+        aacgmv2._aacgmv2.set_datetime(*self.date_args[0])
+        self.mlat = np.zeros(shape=(1,), dtype=np.float64)
+        self.mlon = np.zeros(shape=(1,), dtype=np.float64)
+        self.rshell = np.zeros(shape=(1,), dtype=np.float64)
+        aacgmv2._aacgmv2.convert_buf(np.array([7.0]), np.array([0.0]),
+                                     np.array([0.0]), self.code['G2A'],
+                                     self.mlat, self.mlon, self.rshell)
+
+        assert np.all(np.isnan([self.mlat, self.mlon, self.rshell]))
+
+    @pytest.mark.parametrize('lat_in,lat_out,err',
+                             [(np.array([45.5, 60.0], dtype=np.float32),
+                               np.empty(shape=(2,)), TypeError),
+                              (np.array([45.5, 60.0]), np.empty(shape=(3,)),
+                               ValueError),
+                              (np.array([45.5, 60.0]), b'read-only buffer',
+                               BufferError)])
+    def test_convert_buf_failure(self, lat_in, lat_out, err):
+        """Test convert_buf raises an error for bad buffers"""
+        aacgmv2._aacgmv2.set_datetime(*self.date_args[0])
+        with pytest.raises(err):
+            aacgmv2._aacgmv2.convert_buf(lat_in, np.array(self.lon_in,
+                                                          dtype=np.float64),
+                                         np.array(self.alt_in,
+                                                  dtype=np.float64),
+                                         self.code['G2A'], lat_out,
+                                         np.empty(shape=(2,)),
+                                         np.empty(shape=(2,)))
+
+    def test_convert_mlt_buf(self):
+        """Test convert_mlt_buf matches separate convert and MLT buffer calls
+        """
+        aacgmv2._aacgmv2.set_datetime(*self.long_date)
+        self.lat_in = np.array(self.lat_in + [7.0], dtype=np.float64)
+        self.lon_in = np.array(self.lon_in + [0.0], dtype=np.float64)
+        self.alt_in = np.array(self.alt_in + [0.0], dtype=np.float64)
+        self.mlat = np.empty(shape=(2, 3), dtype=np.float64)
+        self.mlon = np.empty(shape=(2, 3), dtype=np.float64)
+        self.rshell = np.empty(shape=(2, 3), dtype=np.float64)
+        self.mlt = np.empty(shape=(2, 3), dtype=np.float64)
+
+        aacgmv2._aacgmv2.convert_mlt_buf(self.lat_in, self.lon_in,
+                                         self.alt_in, self.code['G2A'],
+                                         *self.long_date, self.mlat[0],
+                                         self.mlon[0], self.rshell[0],
+                                         self.mlt[0])
+        aacgmv2._aacgmv2.convert_buf(self.lat_in, self.lon_in, self.alt_in,
+                                     self.code['G2A'], self.mlat[1],
+                                     self.mlon[1], self.rshell[1])
+        aacgmv2._aacgmv2.mlt_convert_buf(*self.long_date, self.mlon[1],
+                                         self.mlt[1])
+
+        np.testing.assert_equal(self.mlat[0], self.mlat[1])
+        np.testing.assert_equal(self.mlon[0], self.mlon[1])
+        np.testing.assert_equal(self.rshell[0], self.rshell[1])
+        np.testing.assert_equal(self.mlt[0], self.mlt[1])
+        assert np.all(np.isnan(self.mlt[:, 2]))
+
+    def test_convert_mlt_buf_time_failure(self):
+        """Test convert_mlt_buf failure for a time without MLT coefficients"""
+        self.long_date[0] = 1013
+        self.mlat = np.zeros(shape=(1,), dtype=np.float64)
+        with pytest.raises(RuntimeError,
+                           match="^unable to calculate MLT reference, error "
+                           "code -1$"):
+            aacgmv2._aacgmv2.convert_mlt_buf(np.array([45.5]),
+                                             np.array([-23.5]),
+                                             np.array([1135.0]),
+                                             self.code['G2A'],
+                                             *self.long_date, self.mlat,
+                                             np.zeros(shape=(1,)),
+                                             np.zeros(shape=(1,)),
+                                             np.zeros(shape=(1,)))
+        assert self.mlat[0] == 0.0
+
     def test_forbidden(self):
         """Test convert failure"""
         self.lat_in[0] = 7
@@ -162,6 +318,16 @@ class TestCAACGMV2:
         self.mlon = aacgmv2._aacgmv2.inv_mlt_convert(*self.long_date)
         np.testing.assert_almost_equal(self.mlon, mlt_comp, decimal=4)
 
+    def test_inv_mlt_convert_buf(self):
+        """Test MLT inversion for a buffer of values"""
+        self.mlon = np.empty(shape=(3,), dtype=np.float64)
+        aacgmv2._aacgmv2.inv_mlt_convert_buf(*self.long_date,
+                                             np.array([12.0, 25.0, -1.0]),
+                                             self.mlon)
+        np.testing.assert_almost_equal(self.mlon,
+                                       [-153.6033, 41.3967, 11.3967],
+                                       decimal=4)
+
     @pytest.mark.parametrize('marg,mlt_comp',
                              [(12.0, -153.6033), (25.0, 41.3967),
                               (-1.0, 11.3967)])
@@ -188,6 +354,36 @@ class TestCAACGMV2:
         self.mlt = aacgmv2._aacgmv2.mlt_convert(*mlt_args)
         np.testing.assert_almost_equal(self.mlt, mlt_comp, decimal=4)
 
+    def test_mlt_convert_buf(self):
+        """Test MLT calculation for a buffer of longitudes"""
+        self.mlt = np.empty(shape=(3,), dtype=np.float64)
+        aacgmv2._aacgmv2.mlt_convert_buf(*self.long_date,
+                                         np.array([270.0, 80.0, -90.0]),
+                                         self.mlt)
+        np.testing.assert_almost_equal(self.mlt, [16.2402, 3.5736, 16.2402],
+                                       decimal=4)
+
+    @pytest.mark.parametrize('mfunc', ['mlt_convert_buf',
+                                       'inv_mlt_convert_buf'])
+    def test_mlt_convert_buf_time_failure(self, mfunc):
+        """Test MLT buffer calculation failure for a time without coefficients
+        """
+        self.long_date[0] = 1013
+        self.mlt = np.empty(shape=(1,), dtype=np.float64)
+        with pytest.raises(RuntimeError,
+                           match="^unable to calculate MLT reference, error "
+                           "code -1$"):
+            getattr(aacgmv2._aacgmv2, mfunc)(*self.long_date,
+                                             np.array([270.0]), self.mlt)
+
+    def test_mlt_convert_buf_failure(self):
+        """Test MLT calculation failure for mismatched buffers"""
+        self.mlt = np.empty(shape=(2,), dtype=np.float64)
+        with pytest.raises(ValueError, match="buffer lengths are mismatched"):
+            aacgmv2._aacgmv2.mlt_convert_buf(*self.long_date,
+                                             np.array([270.0, 80.0, -90.0]),
+                                             self.mlt)
+
     @pytest.mark.parametrize('marg,mlt_comp',
                              [(270.0, 16.2402), (80.0, 3.5736),
                               (-90.0, 16.2402)])
@@ -188,6 +188,47 @@ class TestConvertLatLonArr(TestConvertArray):
         self.ref = local_ref
         self.evaluate_output()
 
+    def test_convert_latlon_arr_lon_wrap(self):
+        """Test array latlon conversion wraps longitude without altering input
+        """
+        self.lon_in = np.array([360.0, -720.0])
+        self.out = aacgmv2.convert_latlon_arr(self.lat_in, self.lon_in,
+                                              self.alt_in, self.dtime,
+                                              self.method)
+        self.evaluate_output()
+        np.testing.assert_equal(self.lon_in, [360.0, -720.0])
+
+    @pytest.mark.parametrize('dtype', [np.float32, np.int32])
+    def test_convert_latlon_arr_lon_dtype(self, dtype):
+        """Test array latlon conversion for longitudes that are not float64"""
+        self.lon_in = np.array([0, -23], dtype=dtype)
+        self.ref = aacgmv2.convert_latlon_arr(self.lat_in,
+                                              self.lon_in.astype(np.float64),
+                                              self.alt_in, self.dtime,
+                                              self.method)
+        self.out = aacgmv2.convert_latlon_arr(self.lat_in, self.lon_in,
+                                              self.alt_in, self.dtime,
+                                              self.method)
+        np.testing.assert_equal(self.out, self.ref)
+
+    @pytest.mark.parametrize('nprocs', [2, np.int64(2)])
+    def test_convert_latlon_arr_nprocs(self, nprocs):
+        """Test array latlon conversion split between several processes"""
+        self.lat_in = np.linspace(-89.0, 89.0, aacgmv2.min_pool_size)
+        self.ref = aacgmv2.convert_latlon_arr(self.lat_in, self.lon_in[0],
+                                              self.alt_in[0], self.dtime, "G2A")
+        self.out = aacgmv2.convert_latlon_arr(self.lat_in, self.lon_in[0],
+                                              self.alt_in[0], self.dtime, "G2A",
+                                              nprocs=nprocs)
+        np.testing.assert_equal(self.out, self.ref)
+
+    @pytest.mark.parametrize('nprocs', [0, 1.5, True, np.int64(-2)])
+    def test_convert_latlon_arr_nprocs_failure(self, nprocs):
+        """Test array latlon conversion failure for a bad number of processes"""
+        with pytest.raises(ValueError, match="nprocs must be a positive"):
+            aacgmv2.convert_latlon_arr(self.lat_in, self.lon_in, self.alt_in,
+                                       self.dtime, self.method, nprocs=nprocs)
+
     def test_convert_latlon_arr_location_failure(self):
         """Test array latlon conversion with a bad location"""
 
@@ -219,6 +260,17 @@ class TestConvertLatLonArr(TestConvertArray):
                                               self.method)
         self.evaluate_output()
 
+    def test_convert_latlon_arr_clip_no_copy(self):
+        """Test array latlon conversion clipping without altering input"""
+        self.lat_in = np.array([90.01, -90.01])
+        self.ref = [[83.92352053, -74.98110552], [170.1381271, 17.98164313],
+                    [1.04481924, 1.04481924]]
+        self.out = aacgmv2.convert_latlon_arr(self.lat_in, self.lon_in,
+                                              self.alt_in, self.ddate,
+                                              self.method)
+        self.evaluate_output()
+        np.testing.assert_equal(self.lat_in, [90.01, -90.01])
+
     def test_convert_latlon_arr_maxalt_failure(self):
         """test convert_latlon_arr failure for altitudes too high for coeffs"""
         self.method = ""
@@ -226,6 +278,42 @@ class TestConvertLatLonArr(TestConvertArray):
                                               [2001], self.dtime, self.method)
         assert np.all(np.isnan(np.array(self.out)))
 
+    def test_convert_latlon_arr_maxalt_broadcast_failure(self):
+        """test convert_latlon_arr failure for a broadcast altitude too high"""
+        self.method = ""
+        self.out = aacgmv2.convert_latlon_arr(self.lat_in, self.lon_in, 2001,
+                                              self.dtime, self.method)
+        assert np.all(np.isnan(np.array(self.out)))
+
+    @pytest.mark.parametrize('hgt', [[], 300.0])
+    def test_convert_latlon_arr_empty_failure(self, hgt):
+        """Test array latlon conversion failure for empty arrays"""
+        with pytest.raises(ValueError, match="arrays are empty"):
+            aacgmv2.convert_latlon_arr(np.array([]), [], hgt, self.dtime)
+
+    def test_convert_latlon_coords(self):
+        """Test latlon conversion for locations packed in one array"""
+        self.ref = aacgmv2.convert_latlon_arr(self.lat_in, self.lon_in,
+                                              self.alt_in, self.dtime,
+                                              self.method)
+        self.out = aacgmv2.convert_latlon_coords(
+            np.array([self.lat_in, self.lon_in, self.alt_in]).transpose(),
+            self.dtime, self.method)
+        np.testing.assert_equal(self.out, np.transpose(self.ref))
+
+    def test_convert_latlon_coords_empty_failure(self):
+        """Test latlon conversion failure for an empty array"""
+        with pytest.raises(ValueError, match="arrays are empty"):
+            aacgmv2.convert_latlon_coords(np.zeros(shape=(0, 3)), self.dtime)
+
+    @pytest.mark.parametrize('coords', [[60.0, 0.0, 300.0],
+                                        [[60.0, 0.0], [61.0, 0.0]],
+                                        np.zeros(shape=(2, 3, 1))])
+    def test_convert_latlon_coords_failure(self, coords):
+        """Test latlon conversion failure for a badly shaped array"""
+        with pytest.raises(ValueError, match="coords must have a shape"):
+            aacgmv2.convert_latlon_coords(coords, self.dtime)
+
     @pytest.mark.parametrize('in_rep,in_irep,msg',
                              [(None, 3, "must be a datetime object"),
                               ([np.full(shape=(3, 2), fill_value=50.0), 0],
@@ -233,6 +321,8 @@ class TestConvertLatLonArr(TestConvertArray):
                               ([50, 60, 70], 0, "arrays are mismatched"),
                               ([[91, 60, -91], 0, 300], [0, 1, 2],
                                "unrealistic latitude"),
+                              ([[-90.2, 60], 0, 300], [0, 1, 2],
+                               "unrealistic latitude"),
                               (None, 4, "unknown method code")])
     def test_convert_latlon_arr_failure(self, in_rep, in_irep, msg):
         in_args = np.array([self.lat_in, self.lon_in, self.alt_in, self.dtime,
@@ -387,6 +477,30 @@ class TestGetAACGMCoordArr(TestConvertArray):
         assert [isinstance(oo, np.ndarray) and len(oo) == 1 for oo in self.out]
         assert np.any([np.isnan(oo) for oo in self.out])
 
+    @pytest.mark.parametrize('nprocs', [0, 1.5, True])
+    def test_get_aacgm_coord_arr_nprocs_failure(self, nprocs):
+        """Test array AACGMV2 calculation failure for a bad number of processes
+        """
+        with pytest.raises(ValueError, match="nprocs must be a positive"):
+            aacgmv2.get_aacgm_coord_arr(self.lat_in, self.lon_in, self.alt_in,
+                                        self.dtime, self.method, nprocs=nprocs)
+
+    @pytest.mark.parametrize('nprocs', [1, 2])
+    def test_get_aacgm_coord_arr_partial_failure(self, nprocs):
+        """Test array AACGMV2 calculation with good and bad locations"""
+        self.out = aacgmv2.get_aacgm_coord_arr([self.lat_in[0], 0.0],
+                                               [self.lon_in[0], 0.0],
+                                               [self.alt_in[0], 0.0],
+                                               self.dtime, self.method,
+                                               nprocs=nprocs)
+        self.ref = aacgmv2.get_aacgm_coord(self.lat_in[0], self.lon_in[0],
+                                           self.alt_in[0], self.dtime,
+                                           self.method)
+
+        np.testing.assert_allclose([oo[0] for oo in self.out], self.ref,
+                                   rtol=1.0e-6)
+        assert np.all(np.isnan([oo[1] for oo in self.out]))
+
     def test_get_aacgm_coord_arr_mult_failure(self):
         """Test aacgm_coord_arr failure with multi-dim array input"""
 
@@ -420,6 +534,18 @@ class TestGetAACGMCoordArr(TestConvertArray):
                                                self.method)
         self.evaluate_output()
 
+    def test_get_aacgm_coord_arr_nprocs(self):
+        """Test array AACGMV2 calculation is the same with several processes
+        """
+        self.lat_in = np.linspace(-89.0, 89.0, aacgmv2.min_pool_size)
+        self.out = aacgmv2.get_aacgm_coord_arr(self.lat_in, self.lon_in[0],
+                                               self.alt_in[0], self.dtime,
+                                               self.method, nprocs=2)
+        self.ref = aacgmv2.get_aacgm_coord_arr(self.lat_in, self.lon_in[0],
+                                               self.alt_in[0], self.dtime,
+                                               self.method)
+        np.testing.assert_equal(self.out, self.ref)
+
     def test_get_aacgm_coord_arr_maxalt_failure(self):
         """test aacgm_coord_arr failure for an altitude too high for coeff"""
         self.method = ""
@@ -469,12 +595,18 @@ class TestConvertCode:
     @pytest.mark.parametrize('str_code,bit_ref',
                              [("G2A | trace",
                                aacgmv2._aacgmv2.G2A + aacgmv2._aacgmv2.TRACE),
-                              ("ggoogg|", aacgmv2._aacgmv2.G2A)])
+                              ("ggoogg|", aacgmv2._aacgmv2.G2A),
+                              ("TRACE|trace", aacgmv2._aacgmv2.TRACE)])
     def test_non_standard_convert_str_to_bit(self, str_code, bit_ref):
         """Test conversion from string code to bit for non-standard cases"""
         self.out = aacgmv2.convert_str_to_bit(str_code)
         np.testing.assert_equal(self.out, bit_ref)
 
+    def test_convert_str_to_bit_failure(self):
+        """Test conversion from string code to bit failure for a list"""
+        with pytest.raises(AttributeError):
+            aacgmv2.convert_str_to_bit(["G2A"])
+
     @pytest.mark.parametrize('bool_dict,method_code',
                              [({}, 'G2A'), ({'a2g': True}, 'A2G'),
                               ({'trace': True}, 'TRACE'),
@@ -528,6 +660,14 @@ class TestMLTConvert:
             np.testing.assert_almost_equal(self.mlon_out, self.mlon_comp[i],
                                            decimal=4)
 
+    @pytest.mark.parametrize('m2a', [True, False])
+    def test_convert_mlt_single_output_type(self, m2a):
+        """Test MLT conversion of a single value returns an array"""
+        self.mlt_out = aacgmv2.convert_mlt(self.mlt_list[0], self.dtime,
+                                           m2a=m2a)
+        assert isinstance(self.mlt_out, np.ndarray)
+        assert self.mlt_out.shape == (1,)
+
     def test_inv_convert_mlt_list(self):
         """Test MLT inversion for a list"""
         self.mlon_out = aacgmv2.convert_mlt(self.mlt_list, self.dtime, m2a=True)
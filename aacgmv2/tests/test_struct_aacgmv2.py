@@ -118,7 +118,9 @@ class TestCStructure(TestModuleStructure):
         self.reference_list = ["set_datetime", "convert", "inv_mlt_convert",
                                "inv_mlt_convert_yrsec", "mlt_convert",
                                "mlt_convert_yrsec", "inv_mlt_convert_arr",
-                               "mlt_convert_arr", "convert_arr"]
+                               "mlt_convert_arr", "convert_arr", "convert_buf",
+                               "mlt_convert_buf", "inv_mlt_convert_buf",
+                               "convert_mlt_buf", "set_datetime_obj"]
 
     def teardown(self):
         del self.module_name, self.reference_list
@@ -141,7 +143,9 @@ class TestPyStructure(TestModuleStructure):
                                "convert_mlt", "convert_latlon", "test_height",
                                "convert_latlon_arr", "get_aacgm_coord",
                                "get_aacgm_coord_arr", "set_coeff_path",
-                               "test_time"]
+                               "test_time", "_convert_latlon_chunk",
+                               "_prepare_latlon_arr", "convert_latlon_coords",
+                               "_test_nprocs", "_method_bit_code"]
 
     def teardown(self):
         del self.module_name, self.reference_list
@@ -176,7 +180,7 @@ class TestTopStructure(TestModuleStructure):
         self.reference_list = ["convert_bool_to_bit", "convert_str_to_bit",
                                "convert_mlt", "convert_latlon",
                                "convert_latlon_arr", "get_aacgm_coord",
-                               "get_aacgm_coord_arr"]
+                               "get_aacgm_coord_arr", "convert_latlon_coords"]
         self.test_module_functions()
 
     def test_top_modules(self):
@@ -9,6 +9,9 @@
 """
 
 import datetime as dt
+import functools
+import multiprocessing
+import numbers
 import numpy as np
 import os
 import sys
@@ -17,6 +20,12 @@ import aacgmv2
 import aacgmv2._aacgmv2 as c_aacgmv2
 from aacgmv2._aacgmv2 import TRACE, ALLOWTRACE, BADIDEA
 
+# Bit codes for each of the valid string method code elements
+_CONVERT_CODE = {"G2A": c_aacgmv2.G2A, "A2G": c_aacgmv2.A2G,
+                 "TRACE": c_aacgmv2.TRACE, "BADIDEA": c_aacgmv2.BADIDEA,
+                 "GEOCENTRIC": c_aacgmv2.GEOCENTRIC,
+                 "ALLOWTRACE": c_aacgmv2.ALLOWTRACE}
+
 
 def test_time(dtime):
     """ Test the time input and ensure it is a dt.datetime object
@@ -36,14 +45,14 @@ def test_time(dtime):
     ValueError if time is not a dt.date or dt.datetime object
 
     """
-    if isinstance(dtime, dt.date):
-        # Because datetime objects identify as both dt.date and dt.datetime,
-        # you need an extra test here to ensure you don't lose the time
-        # attributes
-        if not isinstance(dtime, dt.datetime):
+    # Because datetime objects identify as both dt.date and dt.datetime, test
+    # for the (most common) dt.datetime first so that the time attributes are
+    # not lost and only one test is needed
+    if not isinstance(dtime, dt.datetime):
+        if isinstance(dtime, dt.date):
             dtime = dt.datetime.combine(dtime, dt.time(0))
-    elif not isinstance(dtime, dt.datetime):
-        raise ValueError('time variable (dtime) must be a datetime object')
+        else:
+            raise ValueError('time variable (dtime) must be a datetime object')
 
     return dtime
 
@@ -223,8 +232,7 @@ def convert_latlon(in_lat, in_lon, height, dtime, method_code="G2A"):
 
     # Set current date and time
     try:
-        c_aacgmv2.set_datetime(dtime.year, dtime.month, dtime.day, dtime.hour,
-                               dtime.minute, dtime.second)
+        c_aacgmv2.set_datetime_obj(dtime)
     except (TypeError, RuntimeError) as err:
         raise RuntimeError("cannot set time for {:}: {:}".format(dtime, err))
 
@@ -243,7 +251,8 @@ def convert_latlon(in_lat, in_lon, height, dtime, method_code="G2A"):
     return lat_out, lon_out, r_out
 
 
-def convert_latlon_arr(in_lat, in_lon, height, dtime, method_code="G2A"):
+def convert_latlon_arr(in_lat, in_lon, height, dtime, method_code="G2A",
+                       nprocs=1):
     """Converts between geomagnetic coordinates and AACGM coordinates.
 
     Parameters
@@ -265,6 +274,12 @@ def convert_latlon_arr(in_lat, in_lon, height, dtime, method_code="G2A"):
         BADIDEA    - use coefficients above 2000 km
         GEOCENTRIC - assume inputs are geocentric w/ RE=6371.2
         (default = "G2A")
+    nprocs : (int)
+        Number of processes used to perform the conversion.  Only used if
+        there are at least aacgmv2.min_pool_size locations.  If new
+        processes are spawned rather than forked (e.g., on macOS and
+        Windows), the calling script must protect its entry point with
+        `if __name__ == "__main__":`. (default=1)
 
     Returns
     -------
@@ -291,52 +306,223 @@ def convert_latlon_arr(in_lat, in_lon, height, dtime, method_code="G2A"):
 
     Multi-dimensional arrays are not allowed.
 
+    All locations are converted in a single loop within the C extension.  This
+    loop is not run in parallel, since the AACGM-v2 C library keeps the
+    interpolated coefficients for the current time and height in global
+    variables.  Large arrays may instead be split between several processes,
+    each with their own copy of the C library, using `nprocs`.
+
     """
-    # Recast the data as numpy arrays
-    in_lat = np.array(in_lat)
-    in_lon = np.array(in_lon)
-    height = np.array(height)
+    # Test the number of processes
+    nprocs = _test_nprocs(nprocs)
 
-    # If one or two of these elements is a float, int, or single element array,
-    # create an array equal to the length of the longest input
-    test_array = np.array([len(in_lat.shape), len(in_lon.shape),
-                           len(height.shape)])
+    # Test and prepare the inputs, setting the time if there is anything to
+    # convert
+    in_lat, in_lon, height, dtime, bit_code, good_height = \
+        _prepare_latlon_arr(in_lat, in_lon, height, dtime, method_code)
 
-    if test_array.max() > 1:
-        raise ValueError("unable to process multi-dimensional arrays")
+    # Initialise output
+    lat_out = np.full(shape=in_lat.shape, fill_value=np.nan)
+    lon_out = np.full(shape=in_lon.shape, fill_value=np.nan)
+    r_out = np.full(shape=height.shape, fill_value=np.nan)
+
+    if not good_height:
+        return lat_out, lon_out, r_out
+
+    if nprocs > 1 and in_lat.size >= aacgmv2.min_pool_size:
+        # Split the locations into roughly equal chunks and convert each of
+        # them in a separate process
+        chunks = [(lat, lon, hgt, dtime, bit_code, os.environ['IGRF_COEFFS'],
+                   os.environ['AACGM_v2_DAT_PREFIX'])
+                  for lat, lon, hgt in zip(np.array_split(in_lat, nprocs),
+                                           np.array_split(in_lon, nprocs),
+                                           np.array_split(height, nprocs))]
+
+        with multiprocessing.Pool(nprocs) as pool:
+            chunk_out = pool.starmap(_convert_latlon_chunk, chunks)
+
+        lat_out, lon_out, r_out = [np.concatenate(cout)
+                                   for cout in zip(*chunk_out)]
     else:
-        if test_array.max() == 0:
-            aacgmv2.logger.info("".join(["for a single location, consider ",
-                                         "using convert_latlon or ",
-                                         "get_aacgm_coord"]))
-            in_lat = np.array([in_lat])
-            in_lon = np.array([in_lon])
-            height = np.array([height])
-        else:
-            max_len = max([len(arr) for i, arr in enumerate([in_lat, in_lon,
-                                                             height])
-                           if test_array[i] > 0])
+        # Convert all locations in a single C loop, bad locations are set to
+        # NaN. The inputs may be strided, so broadcast values are not copied
+        c_aacgmv2.convert_buf(in_lat, in_lon, height, bit_code, lat_out,
+                              lon_out, r_out)
+
+    return lat_out, lon_out, r_out
+
+
+def convert_latlon_coords(coords, dtime, method_code="G2A"):
+    """Converts between geomagnetic and geographic coordinates packed in a
+    single array
+
+    Parameters
+    ----------
+    coords : (np.ndarray or list)
+        Array with a shape of (N, 3), where each row holds the latitude in
+        degrees N, longitude in degrees E, and altitude above the surface of
+        the earth in km of one location (method_code specifies the type of
+        latitude and longitude)
+    dtime : (datetime)
+        Single datetime object for magnetic field
+    method_code : (int or str)
+        Bit code or string denoting which type(s) of conversion to perform
+        G2A        - geographic (geodetic) to AACGM-v2
+        A2G        - AACGM-v2 to geographic (geodetic)
+        TRACE      - use field-line tracing, not coefficients
+        ALLOWTRACE - use trace only above 2000 km
+        BADIDEA    - use coefficients above 2000 km
+        GEOCENTRIC - assume inputs are geocentric w/ RE=6371.2
+        (default = "G2A")
+
+    Returns
+    -------
+    out_coords : (np.ndarray)
+        Array with a shape of (N, 3), where each row holds the output latitude
+        in degrees N, longitude in degrees E, and geocentric radial distance
+        (R_Earth) or altitude above the surface of the Earth (km)
+
+    Raises
+    ------
+    ValueError if input is incorrect
+    RuntimeError if unable to set AACGMV2 datetime
+
+    Notes
+    -----
+    For float64 input, the C extension reads the latitude and height columns
+    of `coords` in place, and writes the outputs directly into the columns of
+    `out_coords`.  The longitudes are always wrapped into a new array, and the
+    latitudes are copied if they need to be clipped to +/- 90 degrees.
+
+    If errors are encountered, NaN or Inf will be included in the output so
+    that all successful calculations are returned.
+
+    """
+    # Recast the data as a float numpy array and test the shape
+    coords = np.asarray(coords, dtype=np.float64)
+
+    if coords.ndim != 2 or coords.shape[1] != 3:
+        raise ValueError("coords must have a shape of (N, 3)")
+
+    # Test and prepare the inputs, setting the time if there is anything to
+    # convert
+    in_lat, in_lon, height, dtime, bit_code, good_height = \
+        _prepare_latlon_arr(coords[:, 0], coords[:, 1], coords[:, 2], dtime,
+                            method_code)
+
+    # Initialise output
+    out_coords = np.full(shape=coords.shape, fill_value=np.nan)
+
+    if good_height:
+        # Convert all locations in a single C loop, writing each output column
+        c_aacgmv2.convert_buf(in_lat, in_lon, height, bit_code,
+                              out_coords[:, 0], out_coords[:, 1],
+                              out_coords[:, 2])
+
+    return out_coords
+
+
+def _test_nprocs(nprocs):
+    """Test the number of processes requested for a conversion
+
+    Parameters
+    ----------
+    nprocs : (int)
+        Number of processes, which may be any integer type except bool
+
+    Returns
+    -------
+    nprocs : (int)
+        Number of processes as a Python integer
+
+    Raises
+    ------
+    ValueError if nprocs is not a positive integer
+
+    """
+    if (isinstance(nprocs, bool) or not isinstance(nprocs, numbers.Integral)
+            or nprocs < 1):
+        raise ValueError("nprocs must be a positive integer")
+
+    return int(nprocs)
+
+
+def _prepare_latlon_arr(in_lat, in_lon, height, dtime, method_code):
+    """Test and prepare inputs for array latitude/longitude conversions
+
+    Parameters
+    ----------
+    in_lat : (np.ndarray or list or float)
+        Input latitude in degrees N (method_code specifies type of latitude)
+    in_lon : (np.ndarray or list or float)
+        Input longitude in degrees E (method_code specifies type of longitude)
+    height : (np.ndarray or list or float)
+        Altitude above the surface of the earth in km
+    dtime : (datetime)
+        Single datetime object for magnetic field
+    method_code : (int or str)
+        Bit code or string denoting which type(s) of conversion to perform
+
+    Returns
+    -------
+    in_lat : (np.ndarray)
+        Broadcast float latitudes in degrees N, clipped to +/- 90
+    in_lon : (np.ndarray)
+        Broadcast float longitudes in degrees E, constrained to +/- 180
+    height : (np.ndarray)
+        Broadcast float altitudes above the surface of the earth in km
+    dtime : (datetime)
+        Datetime object for magnetic field
+    bit_code : (int)
+        Bit code denoting which type(s) of conversion to perform
+    good_height : (bool)
+        True if the heights may be converted, in which case the AACGM-v2
+        date and time have been set.  If False, the latitudes and longitudes
+        have not been tested or prepared
+
+    Raises
+    ------
+    ValueError if input is incorrect
+    RuntimeError if unable to set AACGMV2 datetime
+
+    """
+    # Recast the data as float numpy arrays, without copying arrays that are
+    # already float64.  The inputs are never modified in place.  Numeric
+    # longitudes (e.g., float32) are cast to float64 when they are wrapped
+    in_lat = np.asarray(in_lat, dtype=np.float64)
+    in_lon = np.asarray(in_lon)
+    height = np.asarray(height, dtype=np.float64)
 
-            if not test_array[0] or (len(in_lat) == 1 and max_len > 1):
-                in_lat = np.full(shape=(max_len,), fill_value=in_lat)
-            if not test_array[1] or (len(in_lon) == 1 and max_len > 1):
-                in_lon = np.full(shape=(max_len,), fill_value=in_lon)
-            if not test_array[2] or (len(height) == 1 and max_len > 1):
-                height = np.full(shape=(max_len,), fill_value=height)
+    if in_lon.dtype.kind not in "iuf":
+        in_lon = np.asarray(in_lon, dtype=np.float64)
+
+    # Test the input dimensions
+    max_ndim = max(in_lat.ndim, in_lon.ndim, height.ndim)
+
+    if max_ndim > 1:
+        raise ValueError("unable to process multi-dimensional arrays")
+    elif max_ndim == 0:
+        aacgmv2.logger.info("".join(["for a single location, consider ",
+                                     "using convert_latlon or ",
+                                     "get_aacgm_coord"]))
 
     # Ensure that lat, lon, and height are the same length or if the lengths
-    # differ that the different ones contain only a single value
-    if not (in_lat.shape == in_lon.shape and in_lat.shape == height.shape):
+    # differ that the different ones contain only a single value.  Broadcast
+    # floats, ints, and single element arrays to the length of the longest
+    # input without copying them
+    try:
+        in_lat, in_lon, height = np.broadcast_arrays(np.atleast_1d(in_lat),
+                                                     np.atleast_1d(in_lon),
+                                                     np.atleast_1d(height))
+    except ValueError:
         raise ValueError('lat, lon, and height arrays are mismatched')
 
+    if in_lat.size == 0:
+        raise ValueError('lat, lon, and height arrays are empty')
+
     # Test time
     dtime = test_time(dtime)
 
-    # Initialise output
-    lat_out = np.full(shape=in_lat.shape, fill_value=np.nan)
-    lon_out = np.full(shape=in_lon.shape, fill_value=np.nan)
-    r_out = np.full(shape=height.shape, fill_value=np.nan)
-
     # Test and set the conversion method code
     try:
         bit_code = convert_str_to_bit(method_code.upper())
@@ -346,45 +532,88 @@ def convert_latlon_arr(in_lat, in_lon, height, dtime, method_code="G2A"):
     if not isinstance(bit_code, int):
         raise ValueError("unknown method code {:}".format(method_code))
 
-    # Test height
-    if not test_height(np.nanmax(height), bit_code):
-        return lat_out, lon_out, r_out
-
-    # Test latitude range
-    if np.abs(in_lat).max() > 90.0:
-        if np.abs(in_lat).max() > 90.1:
+    # Test height.  A height broadcast from a single value (zero stride) only
+    # has one value to test.  Empty arrays also have a zero stride, but they
+    # were rejected above, so height[0] always exists here.  The C library
+    # reuses the height-interpolated coefficients between consecutive
+    # locations at the same height, so the conversion needs no special
+    # treatment
+    max_height = height[0] if height.strides == (0,) else np.nanmax(height)
+    if not test_height(max_height, bit_code):
+        return in_lat, in_lon, height, dtime, bit_code, False
+
+    # Test latitude range, using the extreme values to avoid creating an array
+    # of absolute latitudes
+    max_lat = max(-in_lat.min(), in_lat.max())
+    if max_lat > 90.0:
+        if max_lat > 90.1:
             raise ValueError('unrealistic latitude')
         in_lat = np.clip(in_lat, -90.0, 90.0)
 
-    # Constrain longitudes between -180 and 180
-    in_lon = ((in_lon + 180.0) % 360.0) - 180.0
+    # Constrain longitudes between -180 and 180.  Only the first operation
+    # allocates a new float64 array (leaving the input untouched and casting
+    # any other numeric type in the same pass), the rest are performed in place
+    in_lon = np.add(in_lon, 180.0, dtype=np.float64)
+    np.mod(in_lon, 360.0, out=in_lon)
+    np.subtract(in_lon, 180.0, out=in_lon)
 
     # Set current date and time
     try:
-        c_aacgmv2.set_datetime(dtime.year, dtime.month, dtime.day, dtime.hour,
-                               dtime.minute, dtime.second)
+        c_aacgmv2.set_datetime_obj(dtime)
     except (TypeError, RuntimeError) as err:
         raise RuntimeError("cannot set time for {:}: {:}".format(dtime, err))
 
-    try:
-        lat_out, lon_out, r_out, bad_ind = c_aacgmv2.convert_arr(list(in_lat),
-                                                                 list(in_lon),
-                                                                 list(height),
-                                                                 bit_code)
-
-        # Cast the output as numpy arrays or masks
-        lat_out = np.array(lat_out)
-        lon_out = np.array(lon_out)
-        r_out = np.array(r_out)
-        bad_ind = np.array(bad_ind) >= 0
-
-        # Replace any bad indices with NaN, casting output as numpy arrays
-        if np.any(bad_ind):
-            lat_out[bad_ind] = np.nan
-            lon_out[bad_ind] = np.nan
-            r_out[bad_ind] = np.nan
-    except SystemError as serr:
-        aacgmv2.logger.warning('C Error encountered: {:}'.format(serr))
+    return in_lat, in_lon, height, dtime, bit_code, True
+
+
+def _convert_latlon_chunk(in_lat, in_lon, height, dtime, bit_code, igrf_file,
+                          coeff_prefix):
+    """Converts a chunk of locations for `convert_latlon_arr` in a subprocess
+
+    Parameters
+    ----------
+    in_lat : (np.ndarray)
+        Input latitudes in degrees N, already tested and clipped
+    in_lon : (np.ndarray)
+        Input longitudes in degrees E, already constrained to +/- 180
+    height : (np.ndarray)
+        Altitudes above the surface of the earth in km
+    dtime : (datetime)
+        Single datetime object for magnetic field
+    bit_code : (int)
+        Bit code denoting which type(s) of conversion to perform
+    igrf_file : (str)
+        Full filename of IGRF coefficient file used by the parent process
+    coeff_prefix : (str)
+        Location and file prefix for aacgm coefficient files used by the
+        parent process
+
+    Returns
+    -------
+    out_lat : (np.ndarray)
+        Output latitudes in degrees N
+    out_lon : (np.ndarray)
+        Output longitudes in degrees E
+    out_r : (np.ndarray)
+        Geocentric radial distance (R_Earth) or altitude above the surface of
+        the Earth (km)
+
+    Notes
+    -----
+    Processes that are spawned rather than forked re-import aacgmv2, which
+    resets the coefficient files, so the parent process files are set here.
+
+    """
+    set_coeff_path(igrf_file=igrf_file, coeff_prefix=coeff_prefix)
+    c_aacgmv2.set_datetime_obj(dtime)
+
+    lat_out = np.empty(shape=in_lat.shape, dtype=np.float64)
+    lon_out = np.empty(shape=in_lat.shape, dtype=np.float64)
+    r_out = np.empty(shape=in_lat.shape, dtype=np.float64)
+    c_aacgmv2.convert_buf(np.asarray(in_lat, dtype=np.float64),
+                          np.asarray(in_lon, dtype=np.float64),
+                          np.asarray(height, dtype=np.float64),
+                          bit_code, lat_out, lon_out, r_out)
 
     return lat_out, lon_out, r_out
 
@@ -433,7 +662,8 @@ def get_aacgm_coord(glat, glon, height, dtime, method="ALLOWTRACE"):
     return mlat, mlon, mlt
 
 
-def get_aacgm_coord_arr(glat, glon, height, dtime, method="ALLOWTRACE"):
+def get_aacgm_coord_arr(glat, glon, height, dtime, method="ALLOWTRACE",
+                        nprocs=1):
     """Get AACGM latitude, longitude, and magnetic local time
 
     Parameters
@@ -454,6 +684,12 @@ def get_aacgm_coord_arr(glat, glon, height, dtime, method="ALLOWTRACE"):
         GEOCENTRIC - assume inputs are geocentric w/ RE=6371.2
         (default = "TRACE")
         (default = "TRACE")
+    nprocs : (int)
+        Number of processes used to convert to AACGM-v2 coordinates.  Only
+        used if there are at least aacgmv2.min_pool_size locations.  If new
+        processes are spawned rather than forked (e.g., on macOS and
+        Windows), the calling script must protect its entry point with
+        `if __name__ == "__main__":`. (default=1)
 
     Returns
     -------
@@ -464,19 +700,48 @@ def get_aacgm_coord_arr(glat, glon, height, dtime, method="ALLOWTRACE"):
     mlt : (float)
         magnetic local time in hours
 
+    Notes
+    -----
+    Unless several processes are used, the magnetic coordinates and MLT are
+    found for each location in a single pass within the C extension.
+
     """
-    # Initialize method code
+    # Test the number of processes and initialize method code
+    nprocs = _test_nprocs(nprocs)
     method_code = "G2A|{:s}".format(method)
 
-    # Get magnetic lat and lon.
-    mlat, mlon, _ = convert_latlon_arr(glat, glon, height, dtime,
-                                       method_code=method_code)
+    if nprocs > 1:
+        # Get magnetic lat and lon, possibly in several processes
+        mlat, mlon, _ = convert_latlon_arr(glat, glon, height, dtime,
+                                           method_code=method_code,
+                                           nprocs=nprocs)
 
-    if np.any(np.isfinite(mlon)):
-        # Get magnetic local time
-        mlt = convert_mlt(mlon, dtime, m2a=False)
-    else:
-        mlt = np.full(shape=len(mlat), fill_value=np.nan)
+        if np.any(np.isfinite(mlon)):
+            # Get magnetic local time.  Failed locations have NaN longitudes,
+            # which give NaN MLT in the C loop, so they need not be masked
+            mlt = convert_mlt(mlon, dtime, m2a=False)
+        else:
+            mlt = np.full(shape=len(mlat), fill_value=np.nan)
+
+        return mlat, mlon, mlt
+
+    # Test and prepare the inputs, setting the time if there is anything to
+    # convert
+    glat, glon, height, dtime, bit_code, good_height = \
+        _prepare_latlon_arr(glat, glon, height, dtime, method_code)
+
+    # Initialise output
+    mlat = np.full(shape=glat.shape, fill_value=np.nan)
+    mlon = np.full(shape=glat.shape, fill_value=np.nan)
+    mlt = np.full(shape=glat.shape, fill_value=np.nan)
+
+    if good_height:
+        # Get magnetic lat, lon, and local time in a single C loop, bad
+        # locations are set to NaN
+        c_aacgmv2.convert_mlt_buf(glat, glon, height, bit_code, dtime.year,
+                                  dtime.month, dtime.day, dtime.hour,
+                                  dtime.minute, dtime.second, mlat, mlon,
+                                  np.empty(shape=glat.shape), mlt)
 
     return mlat, mlon, mlt
 
@@ -505,19 +770,39 @@ def convert_str_to_bit(method_code):
     Multiple codes should be seperated by pipes '|'.  Invalid parts of the code
     are ignored and no code defaults to 'G2A'.
 
+    The bit codes for recently used method codes are cached, since the same
+    few method codes are used by every conversion.
+
     """
 
-    convert_code = {"G2A": c_aacgmv2.G2A, "A2G": c_aacgmv2.A2G,
-                    "TRACE": c_aacgmv2.TRACE, "BADIDEA": c_aacgmv2.BADIDEA,
-                    "GEOCENTRIC": c_aacgmv2.GEOCENTRIC,
-                    "ALLOWTRACE": c_aacgmv2.ALLOWTRACE}
+    # Force upper case and remove any spaces before finding the bit code
+    bit_code = _method_bit_code(method_code.upper().replace(" ", ""))
+
+    return bit_code
+
+
+@functools.lru_cache(maxsize=32)
+def _method_bit_code(method_code):
+    """Find the bit code for an upper case string code without spaces
 
-    # Force upper case, remove any spaces, and split along pipes
-    method_codes = method_code.upper().replace(" ", "").split("|")
+    Parameters
+    ----------
+    method_code : (str)
+        Upper case string code without spaces, with multiple codes seperated
+        by pipes '|'
+
+    Returns
+    -------
+    bit_code : (int)
+        Method code specification in bits
 
-    # Add the valid parts of the code, invalid elements are ignored
-    bit_code = sum([convert_code[k] for k in method_codes
-                    if k in convert_code.keys()])
+    """
+    # Combine the valid parts of the code, invalid elements are ignored and
+    # repeated elements only set their bit once
+    bit_code = 0
+    for k in method_code.split("|"):
+        if k in _CONVERT_CODE:
+            bit_code |= _CONVERT_CODE[k]
 
     return bit_code
 
@@ -579,10 +864,16 @@ def convert_mlt(arr, dtime, m2a=False):
     out : (np.ndarray)
         Converted coordinates/MLT in degrees E or hours (as appropriate)
 
+    Raises
+    ------
+    ValueError if input is incorrect
+    RuntimeError if unable to calculate the MLT at a single time
+
     Notes
     -----
     This routine previously based on Laundal et al. 2016, but now uses the
-    improved calculation available in AACGM-V2.4.
+    improved calculation available in AACGM-V2.4.  For a single time, the
+    subsolar reference longitude is only calculated once.
 
     """
 
@@ -596,46 +887,40 @@ def convert_mlt(arr, dtime, m2a=False):
     # Test time
     try:
         dtime = test_time(dtime)
-        years = [dtime.year for dd in arr]
-        months = [dtime.month for dd in arr]
-        days = [dtime.day for dd in arr]
-        hours = [dtime.hour for dd in arr]
-        minutes = [dtime.minute for dd in arr]
-        seconds = [dtime.second for dd in arr]
+        dtimes = None
     except ValueError as verr:
-        dtime = np.asarray(dtime)
-        if dtime.shape == ():
+        dtimes = np.asarray(dtime)
+        if dtimes.shape == ():
             raise ValueError(verr)
-        elif dtime.shape != arr.shape:
+        elif dtimes.shape != arr.shape:
             raise ValueError("array input for datetime and MLon/MLT must match")
 
-        years = [dd.year for dd in dtime]
-        months = [dd.month for dd in dtime]
-        days = [dd.day for dd in dtime]
-        hours = [dd.hour for dd in dtime]
-        minutes = [dd.minute for dd in dtime]
-        seconds = [dd.second for dd in dtime]
-
-    arr = list(arr)
-
     # Calculate desired location, C routines set date and time
-    if m2a:
-        # Get the magnetic longitude
-        if len(arr) == 1:
-            out = c_aacgmv2.inv_mlt_convert(years[0], months[0], days[0],
-                                            hours[0], minutes[0], seconds[0],
-                                            arr[0])
+    if dtimes is None:
+        # Convert all values at a single time in one C loop
+        out = np.empty(shape=arr.shape, dtype=np.float64)
+        mlt_args = [dtime.year, dtime.month, dtime.day, dtime.hour,
+                    dtime.minute, dtime.second,
+                    np.asarray(arr, dtype=np.float64), out]
+
+        if m2a:
+            # Get the magnetic longitude
+            c_aacgmv2.inv_mlt_convert_buf(*mlt_args)
         else:
-            out = c_aacgmv2.inv_mlt_convert_arr(years, months, days, hours,
-                                                minutes, seconds, arr)
+            # Get magnetic local time
+            c_aacgmv2.mlt_convert_buf(*mlt_args)
     else:
-        # Get magnetic local time
-        if len(arr) == 1:
-            out = c_aacgmv2.mlt_convert(years[0], months[0], days[0], hours[0],
-                                        minutes[0], seconds[0], arr[0])
-            out = np.array([out])
+        # Convert each value at its own time
+        mlt_args = [[dd.year for dd in dtimes], [dd.month for dd in dtimes],
+                    [dd.day for dd in dtimes], [dd.hour for dd in dtimes],
+                    [dd.minute for dd in dtimes], [dd.second for dd in dtimes],
+                    list(arr)]
+
+        if m2a:
+            # Get the magnetic longitude
+            out = np.array(c_aacgmv2.inv_mlt_convert_arr(*mlt_args))
         else:
-            out = np.array(c_aacgmv2.mlt_convert_arr(years, months, days, hours,
-                                                     minutes, seconds, arr))
+            # Get magnetic local time
+            out = np.array(c_aacgmv2.mlt_convert_arr(*mlt_args))
 
     return out